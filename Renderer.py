@@ -1,14 +1,27 @@
 import pygame
+from pygame._sdl2.video import Window, Renderer, Texture
+from pygame._sdl2.sdl2 import error as SDLError
+import numpy as np
 import config
 import sys
 import time
 from logger import PhysicsLogger
+from physics import step
 
 # Pygame setup
 pygame.init()
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Red Ball Simulation")
+# Hardware-accelerated SDL2 renderer instead of a software display surface
+# No vsync: clock.tick(60) below is the only frame limiter and also provides delta_time
+window = Window("Red Ball Simulation", size=(WIDTH, HEIGHT))
+try:
+    renderer = Renderer(window, accelerated=1)
+except SDLError:
+    # No accelerated driver (VMs, remote sessions, CI): let SDL pick any renderer
+    renderer = Renderer(window, accelerated=-1)
+# Only QUIT is handled, so keep every other event type out of the queue
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(pygame.QUIT)
 
 # Clock and delta time setup
 clock = pygame.time.Clock()
@@ -27,72 +40,98 @@ BALL_RADIUS = 30
 # Scaling: total height of monitor represents 10 meters
 PIXELS_PER_METER = HEIGHT / 10.0
 
+# Number of simulated balls
+NUM_BALLS = 1
+
+# Physics state as structure-of-arrays, one row per ball (meters, m/s)
+# Column 0 is horizontal, column 1 is height above the ground
+pos = np.zeros((NUM_BALLS, 2))
+vel = np.zeros((NUM_BALLS, 2))
+
 # Initial position and velocity from config
-x = 0  # starting horizontal position (meters)
-y = config.InitialHeight  # starting vertical position (meters)
-vx = config.initialVelocityX  # horizontal velocity (m/s)
-vy = config.initialVelocityY  # vertical velocity (m/s)
+pos[:, 0] = 0  # starting horizontal position (meters)
+pos[:, 1] = config.InitialHeight  # starting vertical position (meters)
+initialVelocityX, initialVelocityY = config.compute_initial_velocity(config.Theta, config.Velocity)
+print(f"Initial Velocity X: {initialVelocityX:.2f} m/s")
+print(f"Initial Velocity Y: {initialVelocityY:.2f} m/s")
+vel[:, 0] = initialVelocityX  # horizontal velocity (m/s)
+vel[:, 1] = initialVelocityY  # vertical velocity (m/s)
+
+# Meters -> pixels as one multiply-add per coordinate, folded once at startup
+# Y scale is negative because pygame y increases downward
+PIXEL_SCALE = np.array([PIXELS_PER_METER, -PIXELS_PER_METER])
+PIXEL_OFFSET = np.array([0.0, GROUND_Y])
+
+def to_pixels(pos):
+    """Convert ball positions (meters) to pixel coordinates of each ball's bottom point"""
+    ball_bottom = pos * PIXEL_SCALE + PIXEL_OFFSET
+    return ball_bottom[:, 0], ball_bottom[:, 1]
 
-# Convert initial position to pixel coordinates
-ball_bottom_x = x * PIXELS_PER_METER
-ball_bottom_y = GROUND_Y - (y * PIXELS_PER_METER)  # Subtract because pygame y increases downward
+# Static background (sky + ground), rendered once and uploaded as a texture
+background_surface = pygame.Surface((WIDTH, HEIGHT))
+background_surface.fill(SKY_BLUE)
+pygame.draw.rect(background_surface, GRASS_GREEN, pygame.Rect(0, GROUND_Y, WIDTH, HEIGHT - GROUND_Y))
+BACKGROUND = Texture.from_surface(renderer, background_surface)
+
+# Ball sprite, rasterized once with a transparent background and uploaded as a texture
+ball_surface = pygame.Surface((2 * BALL_RADIUS, 2 * BALL_RADIUS), pygame.SRCALPHA)
+pygame.draw.circle(ball_surface, RED, (BALL_RADIUS, BALL_RADIUS), BALL_RADIUS)
+BALL_TEXTURE = Texture.from_surface(renderer, ball_surface)
 
 def draw(ball_bottom_x, ball_bottom_y):
-    screen.fill(SKY_BLUE)
-    
-    # Draw ground
-    pygame.draw.rect(screen, GRASS_GREEN, pygame.Rect(0, GROUND_Y, WIDTH, HEIGHT - GROUND_Y))
+    # The background covers the whole window, so it doubles as the clear
+    BACKGROUND.draw()
     
-    # Compute center of ball based on bottom point
-    ball_center = (int(ball_bottom_x), int(ball_bottom_y - BALL_RADIUS))
+    # Compute top-left of every ball sprite based on its bottom point
+    left = ball_bottom_x.astype(int) - BALL_RADIUS
+    top = ball_bottom_y.astype(int) - 2 * BALL_RADIUS
     
-    # Draw ball
-    pygame.draw.circle(screen, RED, ball_center, BALL_RADIUS)
+    # Same-texture draws are batched by SDL into one submission at present()
+    for l, t in zip(left.tolist(), top.tolist()):
+        BALL_TEXTURE.draw(dstrect=(l, t, 2 * BALL_RADIUS, 2 * BALL_RADIUS))
+
+# Compile (or load from cache) the numba step now, on throwaway arrays,
+# so that time isn't counted as the first frame's delta_time
+step(np.zeros((1, 2)), np.zeros((1, 2)), config.Gravity, 0.0)
 
 start_time = time.time()
 logger = PhysicsLogger()
+# Reset the clock so the first tick only measures the loop itself
+clock.tick()
 
 # Game loop
 running = True
 falltime = 0
-while running:
-    logger.log_data(time.time(), float(ball_bottom_x/PIXELS_PER_METER),float( -1*((ball_bottom_y-GROUND_Y)/PIXELS_PER_METER)), vx, vy)
-    
-    # Handle events
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
+try:
+    while running:
+        # Only the first ball is logged
+        logger.log_data(time.time() - start_time, pos[0, 0], pos[0, 1], vel[0, 0], vel[0, 1])
+        
+        # Handle events (only QUIT is ever queued, see set_allowed above)
+        if pygame.event.get(pygame.QUIT):
             running = False
-    # Delta time
-    delta_time = clock.tick(60) / 1000.0  # Seconds per frame
-    
-    # Update physics while ball has velocity or is above ground
-    if ball_bottom_y < GROUND_Y or (vx != 0 or vy != 0):
-        if falltime == 0:
-            falltime = time.time() - start_time
-        else:
-            pass
-        # Update velocities (gravity affects vertical velocity)
-        # vy -= ((0.5)*config.Gravity) * (delta_time**2)  # Gravity is negative, so this decreases vy
-        # v = u + at, where a is gravity and u is initial velocity
-        vy += config.Gravity * delta_time
-        # Update positions
-        ball_bottom_x += vx * delta_time * PIXELS_PER_METER
-        ball_bottom_y -= vy * delta_time * PIXELS_PER_METER  # Subtract because pygame y increases downward
+        # Delta time
+        delta_time = clock.tick(60) / 1000.0  # Seconds per frame
         
-        # Check if ball hits ground
-        if ball_bottom_y >= GROUND_Y:
-            ball_bottom_y = GROUND_Y
-            # Stop the ball (no bounce)
-            vx = 0
-            vy = 0
-    
-    # Draw everything
-    draw(ball_bottom_x, ball_bottom_y)
-    
-    # Flip display
-    pygame.display.flip()
+        # Update physics while ball has velocity or is above ground
+        if (pos[:, 1] > 0).any() or vel.any():
+            if falltime == 0:
+                falltime = time.time() - start_time
+            else:
+                pass
+            # Resting balls stay put: gravity is undone by the ground check in step()
+            step(pos, vel, config.Gravity, delta_time)
+        
+        # Draw everything
+        draw(*to_pixels(pos))
+        
+        # Present the frame
+        renderer.present()
+finally:
+    # Save whatever was logged even if the loop dies (Ctrl-C, an exception)
+    logger.save_final()
+    logger.save_npz()
 
 # Cleanup
-logger.save_final()
 pygame.quit()
 sys.exit()
\ No newline at end of file
@@ -6,9 +6,7 @@ Gravity = -9.81  # m/s^2, negative because it acts downwards
 import math
 
 
-initialVelocityX = math.cos(math.radians(Theta)) * Velocity
-initialVelocityY = math.sin(math.radians(Theta)) * Velocity
-
-print(f"Initial Velocity X: {initialVelocityX:.2f} m/s")
-print(f"Initial Velocity Y: {initialVelocityY:.2f} m/s")
-
+def compute_initial_velocity(theta_deg, v):
+    """Split a launch speed at theta_deg degrees into (vx, vy) components"""
+    rad = math.radians(theta_deg)
+    return v * math.cos(rad), v * math.sin(rad)
@@ -1,8 +1,7 @@
-import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
 import os
-import glob
 from qbstyles import mpl_style # Correct import for qbstyles
 
 # Apply the qbstyles dark theme - this sets the foundational dark mode
@@ -25,20 +24,27 @@ NASA_COLORS = {
     "annotation_bg": "#1A1A1A" # Slightly off-black for annotation boxes
 }
 
-def calculate_kinetic_energy(vx: float, vy: float, mass: float = 1.0) -> float:
-    """Calculate kinetic energy: KE = 0.5 * m * v²"""
-    return 0.5 * mass * (vx**2 + vy**2)
+def calculate_kinetic_energy(vx, vy, mass: float = 1.0):
+    """Calculate kinetic energy: KE = 0.5 * m * v² (works on scalars or whole numpy arrays)"""
+    return 0.5 * mass * (vx * vx + vy * vy)
 
-def calculate_displacement(x: float, y: float, initial_x: float, initial_y: float) -> float:
-    """Calculate total displacement from initial position"""
-    return np.sqrt((x - initial_x)**2 + (y - initial_y)**2)
+def calculate_displacement(x, y, initial_x: float, initial_y: float):
+    """Calculate total displacement from initial position (works on scalars or whole numpy arrays)"""
+    return np.hypot(x - initial_x, y - initial_y)
 
-def load_data(csv_filename: str) -> pd.DataFrame | None:
-    """Load data from a CSV file."""
+# Column names used by PhysicsLogger.save_npz, in CSV column order
+NPZ_KEYS = ('time', 'x', 'y', 'vx', 'vy')
+
+def load_data(csv_filename: str) -> tuple[np.ndarray, ...] | None:
+    """Load data from a CSV (or the logger's columnar .npz) file as (time, x_pos, y_pos, vx, vy) arrays."""
     try:
-        df = pd.read_csv(csv_filename)
-        print(f"Loaded {len(df)} data points from {csv_filename}")
-        return df
+        if csv_filename.endswith('.npz'):
+            with np.load(csv_filename) as npz:
+                columns = np.stack([npz[key] for key in NPZ_KEYS]).astype(np.float64, copy=False)
+        else:
+            columns = np.loadtxt(csv_filename, delimiter=',', skiprows=1, dtype=np.float64, ndmin=2, unpack=True)
+        print(f"Loaded {columns.shape[1]} data points from {csv_filename}")
+        return tuple(columns)
     except FileNotFoundError:
         print(f"Error: Could not find file {csv_filename}")
         return None
@@ -47,8 +53,8 @@ def load_data(csv_filename: str) -> pd.DataFrame | None:
         return None
 
 def plot_data(ax, x_data, y_data, title, xlabel, ylabel, color, marker=None, legend_label=None, linewidth=1.5):
-    """Helper function to plot data on a given axes with NASA-inspired minimalist styling."""
-    ax.plot(x_data, y_data, color=color, linewidth=linewidth, marker=marker, markersize=4 if marker else 0, label=legend_label) # Smaller markers if used
+    """Helper function to plot data on a given axes with NASA-inspired minimalist styling. Returns the Line2D."""
+    line, = ax.plot(x_data, y_data, color=color, linewidth=linewidth, marker=marker, markersize=4 if marker else 0, label=legend_label) # Smaller markers if used
     ax.set_title(title, fontsize=12, fontweight='normal', color=NASA_COLORS["text_main"]) # Slightly smaller, normal weight for subplot titles
     ax.set_xlabel(xlabel, fontsize=10, color=NASA_COLORS["text_secondary"])
     ax.set_ylabel(ylabel, fontsize=10, color=NASA_COLORS["text_secondary"])
@@ -68,81 +74,133 @@ def plot_data(ax, x_data, y_data, title, xlabel, ylabel, color, marker=None, leg
     if legend_label:
         ax.legend(fontsize=9, facecolor=NASA_COLORS["annotation_bg"], edgecolor=NASA_COLORS["grid_line"], labelcolor=NASA_COLORS["text_secondary"], framealpha=0.7)
 
+    return line
 
-def generate_physics_graphs(csv_filename: str, save_plots: bool = True):
-    """
-    Generate physics graphs from CSV data with a professional, minimalist, NASA-inspired dark theme.
-    """
-    df = load_data(csv_filename)
-    if df is None:
-        return
 
-    time = df['Time'].values
-    x_pos = df['X_Position'].values
-    y_pos = df['Y_Position'].values
-    vx = df['Velocity_X'].values
-    vy = df['Velocity_Y'].values
+# Figures and artists kept between generate_physics_graphs calls, keyed by the show flag
+_GRAPH_CACHE = {}
 
-    initial_x, initial_y = x_pos[0], y_pos[0]
-    kinetic_energy = np.array([calculate_kinetic_energy(vx[i], vy[i]) for i in range(len(vx))])
-    displacement = np.array([calculate_displacement(x_pos[i], y_pos[i], initial_x, initial_y) for i in range(len(x_pos))])
 
-    fig, axes = plt.subplots(2, 2, figsize=(12, 9)) # Slightly adjusted figsize for better proportions
-    fig.suptitle(f'Projectile Motion Analysis: {os.path.basename(csv_filename)}', fontsize=15, fontweight='bold', color=NASA_COLORS["text_main"])
+def _build_figure(show: bool) -> dict:
+    """Create the 2x2 figure with styled, empty artists that later calls fill with data."""
+    if show:
+        fig, axes = plt.subplots(2, 2, figsize=(12, 9)) # Slightly adjusted figsize for better proportions
+    else:
+        fig = Figure(figsize=(12, 9))
+        axes = fig.subplots(2, 2)
+    suptitle = fig.suptitle('', fontsize=15, fontweight='bold', color=NASA_COLORS["text_main"])
     # qbstyles should set the fig facecolor, ensure it's dark. If needed: fig.set_facecolor('#0a0f1a')
 
     ax1, ax2, ax3, ax4 = axes.flatten()
+    empty = np.empty(0)
 
     # Common text annotation style
     annotation_bbox_style = dict(boxstyle='round,pad=0.3', facecolor=NASA_COLORS["annotation_bg"], alpha=0.6, edgecolor=NASA_COLORS["grid_line"])
     annotation_text_color = NASA_COLORS["text_secondary"]
     annotation_fontsize = 8
 
+    def annotate(ax):
+        return ax.text(0.03, 0.97, '', transform=ax.transAxes, verticalalignment='top', color=annotation_text_color,
+                       bbox=annotation_bbox_style, fontsize=annotation_fontsize)
+
+    lines, texts = {}, {}
+
     # 1. Kinetic Energy vs Time
-    plot_data(ax1, time, kinetic_energy, 'Kinetic Energy vs Time', 'Time (s)', 'Kinetic Energy (J)', NASA_COLORS["teal"])
-    ax1.text(0.03, 0.97, f'Max KE: {kinetic_energy.max():.2f} J\nMin KE: {kinetic_energy.min():.2f} J',
-             transform=ax1.transAxes, verticalalignment='top', color=annotation_text_color,
-             bbox=annotation_bbox_style, fontsize=annotation_fontsize)
+    lines["ke"] = plot_data(ax1, empty, empty, 'Kinetic Energy vs Time', 'Time (s)', 'Kinetic Energy (J)', NASA_COLORS["teal"])
+    texts["ke"] = annotate(ax1)
 
     # 2. Trajectory (Y vs X)
-    plot_data(ax2, x_pos, y_pos, 'Trajectory (Y vs X Position)', 'X Position (m)', 'Y Position (m)', NASA_COLORS["light_grey"])
+    lines["trajectory"] = plot_data(ax2, empty, empty, 'Trajectory (Y vs X Position)', 'X Position (m)', 'Y Position (m)', NASA_COLORS["light_grey"])
     # ax2.scatter(x_pos[0], y_pos[0], color=NASA_COLORS["accent_yellow"], s=60, marker='o', label='Start', zorder=5, edgecolors='black', linewidth=0.5)
     # ax2.scatter(x_pos[-1], y_pos[-1], color=NASA_COLORS["accent_red"], s=60, marker='s', label='End', zorder=5, edgecolors='black', linewidth=0.5)
     ax2.set_aspect('equal', adjustable='box')
     ax2.legend(fontsize=9, facecolor=NASA_COLORS["annotation_bg"], edgecolor=NASA_COLORS["grid_line"], labelcolor=NASA_COLORS["text_secondary"], framealpha=0.7)
-    ax2.text(0.03, 0.97, f'Max Height: {y_pos.max():.2f} m\nRange: {x_pos.max() - x_pos.min():.2f} m',
-             transform=ax2.transAxes, verticalalignment='top', color=annotation_text_color,
-             bbox=annotation_bbox_style, fontsize=annotation_fontsize)
+    texts["trajectory"] = annotate(ax2)
 
     # 3. Velocity Components vs Time
-    plot_data(ax3, time, vx, 'Velocity Components vs Time', 'Time (s)', 'Velocity (m/s)', NASA_COLORS["blue"], legend_label='Velocity X')
+    lines["vx"] = plot_data(ax3, empty, empty, 'Velocity Components vs Time', 'Time (s)', 'Velocity (m/s)', NASA_COLORS["blue"], legend_label='Velocity X')
     # For the second plot on the same axis, we don't want to repeat title and labels
-    ax3.plot(time, vy, color=NASA_COLORS["orange"], linewidth=1.5, label='Velocity Y')
+    lines["vy"], = ax3.plot(empty, empty, color=NASA_COLORS["orange"], linewidth=1.5, label='Velocity Y')
     ax3.axhline(y=0, color=NASA_COLORS["grid_line"], linestyle='--', alpha=0.5)
     ax3.legend(fontsize=9, facecolor=NASA_COLORS["annotation_bg"], edgecolor=NASA_COLORS["grid_line"], labelcolor=NASA_COLORS["text_secondary"], framealpha=0.7)
-    ax3.text(0.03, 0.97, f'Vx (initial): {vx[0]:.2f} m/s\nVy range: [{vy.min():.2f}, {vy.max():.2f}] m/s',
-             transform=ax3.transAxes, verticalalignment='top', color=annotation_text_color,
-             bbox=annotation_bbox_style, fontsize=annotation_fontsize)
+    texts["velocity"] = annotate(ax3)
 
     # 4. Total Displacement vs Time
-    plot_data(ax4, time, displacement, 'Displacement from Origin vs Time', 'Time (s)', 'Displacement (m)', NASA_COLORS["light_blue"])
-    ax4.text(0.03, 0.97, f'Max Disp: {displacement.max():.2f} m\nFinal Disp: {displacement[-1]:.2f} m',
-             transform=ax4.transAxes, verticalalignment='top', color=annotation_text_color,
-             bbox=annotation_bbox_style, fontsize=annotation_fontsize)
+    lines["displacement"] = plot_data(ax4, empty, empty, 'Displacement from Origin vs Time', 'Time (s)', 'Displacement (m)', NASA_COLORS["light_blue"])
+    texts["displacement"] = annotate(ax4)
+
+    return {"fig": fig, "axes": axes.flatten(), "suptitle": suptitle, "lines": lines, "texts": texts}
+
 
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+def _get_figure(show: bool) -> dict:
+    """Return the cached figure for this mode, rebuilding it if it was never made or has been closed."""
+    graph = _GRAPH_CACHE.get(show)
+    if graph is None or (show and not plt.fignum_exists(graph["fig"].number)):
+        graph = _GRAPH_CACHE[show] = _build_figure(show)
+    return graph
+
+
+def generate_physics_graphs(csv_filename: str, save_plots: bool = True, show: bool = True):
+    """
+    Generate physics graphs from CSV data with a professional, minimalist, NASA-inspired dark theme.
+
+    With show=False the figure is built without pyplot, so no GUI backend is started;
+    use this for batch runs where the graphs only need to be saved.
+    The figure and its artists are reused across calls; only their data is replaced.
+    """
+    data = load_data(csv_filename)
+    if data is None:
+        return
+
+    time, x_pos, y_pos, vx, vy = data
+
+    initial_x, initial_y = x_pos[0], y_pos[0]
+    # Whole-array numpy ops instead of a Python-level call per row
+    kinetic_energy = calculate_kinetic_energy(vx, vy)
+    displacement = calculate_displacement(x_pos, y_pos, initial_x, initial_y)
+
+    # Reductions used by both the annotations and the summary, computed once
+    stats = {
+        "ke_min": np.min(kinetic_energy), "ke_max": np.max(kinetic_energy),
+        "max_height": np.max(y_pos), "range": np.ptp(x_pos),
+        "vy_min": np.min(vy), "vy_max": np.max(vy),
+        "max_disp": np.max(displacement),
+    }
+
+    graph = _get_figure(show)
+    fig, lines, texts = graph["fig"], graph["lines"], graph["texts"]
+    graph["suptitle"].set_text(f'Projectile Motion Analysis: {os.path.basename(csv_filename)}')
+
+    # Point the existing artists at the new data instead of rebuilding them
+    lines["ke"].set_data(time, kinetic_energy)
+    lines["trajectory"].set_data(x_pos, y_pos)
+    lines["vx"].set_data(time, vx)
+    lines["vy"].set_data(time, vy)
+    lines["displacement"].set_data(time, displacement)
+
+    texts["ke"].set_text(f'Max KE: {stats["ke_max"]:.2f} J\nMin KE: {stats["ke_min"]:.2f} J')
+    texts["trajectory"].set_text(f'Max Height: {stats["max_height"]:.2f} m\nRange: {stats["range"]:.2f} m')
+    texts["velocity"].set_text(f'Vx (initial): {vx[0]:.2f} m/s\nVy range: [{stats["vy_min"]:.2f}, {stats["vy_max"]:.2f}] m/s')
+    texts["displacement"].set_text(f'Max Disp: {stats["max_disp"]:.2f} m\nFinal Disp: {displacement[-1]:.2f} m')
+
+    for ax in graph["axes"]:
+        ax.relim()
+        ax.autoscale_view()
+
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
 
     if save_plots:
         output_filename = f"{os.path.splitext(csv_filename)[0]}_analysis_nasa_themed.png"
         # Ensure the figure facecolor from qbstyles is used for saving
-        plt.savefig(output_filename, dpi=300, bbox_inches='tight', facecolor=fig.get_facecolor())
+        fig.savefig(output_filename, dpi=300, bbox_inches='tight', facecolor=fig.get_facecolor())
         print(f"Graphs saved as: {output_filename}")
 
-    plt.show()
-    display_summary_statistics(time, x_pos, y_pos, vx, vy, kinetic_energy, displacement)
+    if show:
+        plt.show()
+    display_summary_statistics(time, x_pos, y_pos, vx, vy, stats)
 
 
-def display_summary_statistics(time, x_pos, y_pos, vx, vy, kinetic_energy, displacement):
+def display_summary_statistics(time, x_pos, y_pos, vx, vy, stats):
     """Prints a summary of the physics analysis."""
     print("\n" + "=" * 50)
     print("PHYSICS ANALYSIS SUMMARY")
@@ -153,31 +211,33 @@ def display_summary_statistics(time, x_pos, y_pos, vx, vy, kinetic_energy, displ
     print(f"Final Position: ({x_pos[-1]:.3f}, {y_pos[-1]:.3f}) m")
     print(f"Initial Velocity: ({vx[0]:.3f}, {vy[0]:.3f}) m/s")
     print(f"Final Velocity: ({vx[-1]:.3f}, {vy[-1]:.3f}) m/s")
-    print(f"Maximum Height: {y_pos.max():.3f} m")
-    print(f"Range: {x_pos.max() - x_pos.min():.3f} m")
-    print(f"Maximum Kinetic Energy: {kinetic_energy.max():.3f} J")
-    print(f"Minimum Kinetic Energy: {kinetic_energy.min():.3f} J")
-    print(f"Maximum Displacement: {displacement.max():.3f} m")
+    print(f"Maximum Height: {stats['max_height']:.3f} m")
+    print(f"Range: {stats['range']:.3f} m")
+    print(f"Maximum Kinetic Energy: {stats['ke_max']:.3f} J")
+    print(f"Minimum Kinetic Energy: {stats['ke_min']:.3f} J")
+    print(f"Maximum Displacement: {stats['max_disp']:.3f} m")
     print("=" * 50)
 
 
 def find_latest_csv() -> str | None:
-    """Find the most recent projectile data CSV file."""
-    csv_files = glob.glob("projectile_data_*.csv")
-    if not csv_files:
-        print("No projectile data CSV files found in the current directory.")
+    """Find the most recent projectile data file (CSV or .npz)."""
+    with os.scandir('.') as it:
+        data_files = [entry for entry in it
+                     if entry.name.startswith("projectile_data_") and entry.name.endswith((".csv", ".npz")) and entry.is_file()]
+    if not data_files:
+        print("No projectile data files (.csv or .npz) found in the current directory.")
         return None
-    return max(csv_files, key=os.path.getmtime)
+    return max(data_files, key=lambda entry: entry.stat().st_mtime).name
 
 def get_csv_filename_from_user(latest_csv: str | None) -> str:
-    """Prompts the user for a CSV filename, offering the latest found file as default."""
+    """Prompts the user for a data filename (CSV or .npz), offering the latest found file as default."""
     if latest_csv:
-        use_latest = input(f"Found latest CSV file: '{latest_csv}'. Use this file? (y/n, default=y): ").strip().lower()
+        use_latest = input(f"Found latest data file: '{latest_csv}'. Use this file? (y/n, default=y): ").strip().lower()
         if use_latest in ('y', ''):
             return latest_csv
     
-    filename = input("Enter the CSV filename (e.g., 'data.csv'): ").strip()
-    return filename if filename.endswith('.csv') else f"{filename}.csv"
+    filename = input("Enter the data filename (e.g., 'data.csv' or 'data.npz'): ").strip()
+    return filename if filename.endswith(('.csv', '.npz')) else f"{filename}.csv"
 
 
 def main():
@@ -1,30 +1,55 @@
-import csv
 import os
 from datetime import datetime
 
+import numpy as np
+
 class PhysicsLogger:
-    def __init__(self, filename=None):
+    def __init__(self, filename=None, max_samples=3600, dtype=np.float32, flush_every=60):
         """
         Initialize the physics data logger
         
         Args:
             filename (str): Custom filename for the CSV. If None, generates timestamp-based name
+            max_samples (int): Number of samples to preallocate (3600 = one minute at 60 FPS).
+                               The buffer grows automatically if a run is longer.
+            dtype: Sample precision. float32 is plenty for plotting and halves memory and file size;
+                   times should be relative to the start of the run, not epoch seconds.
+            flush_every (int): Write buffered samples to the CSV every this many samples
+                               (60 = once a second at 60 FPS), so a crash loses at most a batch.
         """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"projectile_data_{timestamp}.csv"
         
         self.filename = filename
-        self.data = []
         self.headers = ['Time', 'X_Position', 'Y_Position', 'Velocity_X', 'Velocity_Y']
+        # Preallocated (samples, columns) buffer; only the first self.n rows are valid
+        self.buf = np.empty((max_samples, len(self.headers)), dtype=dtype)
+        self.n = 0
+        self.flush_every = flush_every
         
-        # Create CSV file with headers
-        with open(self.filename, 'w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(self.headers)
+        self._open_csv()
         
         print(f"Physics logger initialized. Data will be saved to: {self.filename}")
     
+    def _open_csv(self):
+        """
+        Create the CSV file with headers and keep it open until save_final;
+        rows are appended in batches by _flush_rows
+        """
+        self._fh = open(self.filename, 'w', newline='', buffering=1 << 16)
+        self._fh.write(','.join(self.headers) + '\n')
+        # Number of buffered rows already written to the CSV
+        self._written = 0
+    
+    def _flush_rows(self):
+        """Append the rows logged since the last flush to the CSV"""
+        if self.n > self._written and not self._fh.closed:
+            # 9 significant digits round-trip float32 exactly
+            np.savetxt(self._fh, self.buf[self._written:self.n], fmt='%.9g', delimiter=',')
+            self._fh.flush()
+            self._written = self.n
+    
     def log_data(self, time, x_pos, y_pos, vel_x, vel_y):
         """
         Log physics data point
@@ -36,30 +61,94 @@ class PhysicsLogger:
             vel_x (float): X velocity in m/s
             vel_y (float): Y velocity in m/s
         """
-        data_point = [time, x_pos, y_pos, vel_x, vel_y]
-        self.data.append(data_point)
+        if self.n == len(self.buf):
+            self._grow()
+        self.buf[self.n] = (time, x_pos, y_pos, vel_x, vel_y)
+        self.n += 1
+        if self.n - self._written >= self.flush_every:
+            self._flush_rows()
+    
+    def log_from(self, fill, max_total):
+        """
+        Append samples written straight into the buffer, then write them to the CSV
         
-        # Append to CSV file immediately
-        with open(self.filename, 'a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(data_point)
+        Args:
+            fill (callable): fill(buf) writes rows into buf (the buffer's free rows) from the
+                             start and returns how many it wrote. If it fills buf completely the
+                             run may have been cut short, so the buffer is doubled and fill runs again.
+            max_total (int): Ceiling on the rows fill may write. If fill still fills that many
+                             (e.g. a trajectory that never lands), the run is truncated with a warning.
+        
+        Returns:
+            int: Number of data points appended
+        """
+        start = self.n
+        while True:
+            free = self.buf[start:]
+            n = fill(free)
+            if n < len(free):
+                break
+            if len(free) >= max_total:
+                print(f"Warning: run truncated at {n} data points (limit {max_total})")
+                break
+            self._grow(start + max_total)
+        self.n = start + n
+        self._flush_rows()
+        return n
+    
+    def _grow(self, max_total=None):
+        """Out of preallocated room: double the buffer (at least one row, at most max_total rows)"""
+        size = max(2 * len(self.buf), 1)
+        if max_total is not None:
+            size = min(size, max_total)
+        grown = np.empty((size, self.buf.shape[1]), dtype=self.buf.dtype)
+        grown[:self.n] = self.buf[:self.n]
+        self.buf = grown
+    
+    def get_data(self):
+        """Return the logged samples as a (n, 5) numpy view (no copy)"""
+        return self.buf[:self.n]
     
     def get_data_count(self):
         """Return the number of data points logged"""
-        return len(self.data)
+        return self.n
+    
+    def close(self):
+        """Flush buffered rows and close the CSV file"""
+        if not self._fh.closed:
+            self._fh.flush()
+            self._fh.close()
     
     def save_final(self):
         """
-        Optional method to perform any final operations
-        Currently just prints summary
+        Write any remaining samples to the CSV, close it, then print a summary
+        """
+        self._flush_rows()
+        self.close()
+        print(f"Data logging complete. {self.n} data points saved to {self.filename}")
+        if self.n:
+            print(f"Time range: {self.buf[0, 0]:.3f}s to {self.buf[self.n - 1, 0]:.3f}s")
+    
+    def save_npz(self, filename=None):
+        """
+        Save the logged samples as a columnar .npz file (one contiguous array per column),
+        which graph.py loads without any text parsing
+        
+        Args:
+            filename (str): Output path. If None, uses the CSV filename with a .npz extension
+        
+        Returns:
+            str: The path written
         """
-        print(f"Data logging complete. {len(self.data)} data points saved to {self.filename}")
-        if self.data:
-            print(f"Time range: {self.data[0][0]:.3f}s to {self.data[-1][0]:.3f}s")
+        if filename is None:
+            filename = f"{os.path.splitext(self.filename)[0]}.npz"
+        data = self.get_data()
+        np.savez(filename, time=data[:, 0], x=data[:, 1], y=data[:, 2], vx=data[:, 3], vy=data[:, 4])
+        print(f"Columnar data saved to {filename}")
+        return filename
     
     def clear_data(self):
         """Clear all logged data and reinitialize the CSV file"""
-        self.data = []
-        with open(self.filename, 'w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(self.headers)
\ No newline at end of file
+        self.n = 0
+        self.close()
+        self._open_csv()
@@ -0,0 +1,123 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
+@njit(cache=True)
+def step(pos, vel, gravity, dt, ground_y=0.0):
+    """
+    Advance every ball by one Euler step in place and stop those that hit the ground
+
+    Args:
+        pos (ndarray): (N, 2) positions in meters, column 1 is height
+        vel (ndarray): (N, 2) velocities in m/s
+        gravity (float): Vertical acceleration in m/s^2 (negative is down)
+        dt (float): Time step in seconds
+        ground_y (float): Height of the ground in meters
+    """
+    for i in range(pos.shape[0]):
+        # v = u + at, where a is gravity and u is initial velocity
+        vel[i, 1] += gravity * dt
+        pos[i, 0] += vel[i, 0] * dt
+        pos[i, 1] += vel[i, 1] * dt
+        # Check if ball hits ground and stop it (no bounce)
+        if pos[i, 1] <= ground_y:
+            pos[i, 1] = ground_y
+            vel[i, 0] = 0.0
+            vel[i, 1] = 0.0
+
+
+@njit(cache=True)
+def simulate_trajectory(x, y, vx, vy, gravity, dt, out, ground_y=0.0):
+    """
+    Integrate a single trajectory until it lands, writing samples into out
+
+    Each row of out is (time, x, y, vx, vy), matching PhysicsLogger's columns.
+    Stops early if out is full.
+
+    Returns:
+        int: Number of rows written
+    """
+    t = 0.0
+    n = 0
+    landed = False
+    while n < out.shape[0]:
+        out[n, 0] = t
+        out[n, 1] = x
+        out[n, 2] = y
+        out[n, 3] = vx
+        out[n, 4] = vy
+        n += 1
+        if landed:
+            break
+        vy += gravity * dt
+        x += vx * dt
+        y += vy * dt
+        t += dt
+        if y <= ground_y:
+            y = ground_y
+            vx = 0.0
+            vy = 0.0
+            landed = True
+    return n
+
+
+@njit(parallel=True, cache=True)
+def simulate_batch(theta, v, height, gravity, dt, out, ground_y=0.0):
+    """
+    Integrate many independent launches in parallel (parameter sweeps)
+
+    Args:
+        theta (ndarray): (B,) launch angles in degrees
+        v (ndarray): (B,) launch speeds in m/s
+        height (ndarray): (B,) initial heights in meters
+        gravity (float): Vertical acceleration in m/s^2 (negative is down)
+        dt (float): Time step in seconds
+        out (ndarray): (B, max_samples, 5) buffer, one simulate_trajectory output per launch
+        ground_y (float): Height of the ground in meters
+
+    Returns:
+        ndarray: (B,) number of rows written for each launch
+    """
+    counts = np.empty(theta.shape[0], dtype=np.int64)
+    for i in prange(theta.shape[0]):
+        rad = math.radians(theta[i])
+        counts[i] = simulate_trajectory(0.0, height[i], v[i] * math.cos(rad), v[i] * math.sin(rad),
+                                        gravity, dt, out[i], ground_y)
+    return counts
+
+
+def run_headless(logger, x, y, vx, vy, gravity, dt=1 / 60, max_duration=600.0):
+    """
+    Simulate a trajectory without pygame and store it straight into the logger's buffer
+
+    A trajectory that never lands (e.g. gravity set to 0 or positive) is cut off
+    after max_duration simulated seconds.
+    """
+    max_total = int(max_duration / dt) + 1
+    return logger.log_from(lambda buf: simulate_trajectory(x, y, vx, vy, gravity, dt, buf), max_total)
+
+
+if __name__ == "__main__":
+    import config
+    from logger import PhysicsLogger
+
+    initialVelocityX, initialVelocityY = config.compute_initial_velocity(config.Theta, config.Velocity)
+    print(f"Initial Velocity X: {initialVelocityX:.2f} m/s")
+    print(f"Initial Velocity Y: {initialVelocityY:.2f} m/s")
+
+    logger = PhysicsLogger()
+    run_headless(logger, 0.0, float(config.InitialHeight), initialVelocityX,
+                 initialVelocityY, config.Gravity)
+    logger.save_final()
+    logger.save_npz()